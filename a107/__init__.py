@@ -21,23 +21,61 @@ logging_fmt = '[%(levelname)-8s] %(message)s'
 # Name for the python logger
 logging_name = "a107"
 
-from .config import *
-from .datetimefunc import *
-from .conversion import *
-from .parts import *
-from .loggingaux import *
-from .search import *
-from .textinterface import *
-from .introspection import *
-from .misc import *
-from .console import *
-from .fileio import *
-from .statementparsing import *
-from .filesqlite import *
-from .asciichart import *
-from .npmaths import *
-from .maths import *
-from .htmlstuff import *
-from .autoclass import *
-from .datafile import *
-del logging
\ No newline at end of file
+from .config import AAConfigObj, get_config_obj
+from .datetimefunc import (
+    now_str, date2datetime, dt2ts, ts2dt, dt2str, str2dt, ts2str, time2seconds, seconds2time, v_time2seconds,
+    v_seconds2time, to_datetime, str2ts, iso8601_to_float, float_to_iso8601, dt2slug, v_ts2dt, v_ts2dt64,
+    to_timestamp, tzinfo_tz, utc, now_ts, ts_now, to_ts_utc, human2ts)
+from .conversion import (
+    str2bool, to_bool, bool2str, chunk_string, chunk_string_list, chunk_bytes, ordinal_suffix, seconds2str,
+    module2dict, unicode2greek, greek2unicode, unicode2greek_bulk, greek2unicode_bulk, make_code_readable,
+    int2superscript, color2hex, hex2color, rowsheader2dictlist, ffmt, smartfloat, sorp, split_cell, join_cell)
+from .parts import AttrsPart, froze_it, keydefaultdict, classproperty, StupidRobotParty
+from .loggingaux import (
+    get_python_logger, add_file_handler, reset_logger, LogTwo, SmartFormatter, str_exc, get_new_logger,
+    log_exception_as_info, log_exception_as_error, ColorFormatter, stre)
+from .search import index_nearest, BSearch, BSearchRound, BSearchCeil, BSearchFloor, FindNotNaNBackwards
+from .textinterface import (
+    format_h1, format_h2, format_h3, format_h4, format_error, format_warning, format_debug, print_error, menu,
+    format_progress, markdown_table, format_box, yesno, rest_table, expand_multirow_data, question, format_slug,
+    print_file, aargh, format_yoda, format_madyoda, print_cfg, format_color, print_girafales, fancilyquoted,
+    format_h, print_polluted, kebab, print_yoda)
+from .introspection import (
+    import_module, collect_doc, get_classes_in_module, get_obj_doc0, get_subpackages_names, get_argsdict)
+from .misc import random_name, cowsay_what
+from .console import ConsoleCommands, Console, ConsoleError, console_bool, embed_ipython
+from .fileio import (
+    rename_to_temp, is_text_file, add_bits_to_path, add_parts_to_path, crunch_dir, slugify, write_lf, get_path,
+    write_lines, new_filename, temp_filename, sequential_filename, create_symlink, which, ensure_path, open_html,
+    sequential_filename_with_dateslug)
+from .statementparsing import str2args, StatementError
+from .asciichart import asciichart
+from .npmaths import triangularwave, sigmoid, make_impulseresponse
+from .maths import sign
+from .autoclass import AutoClass
+from .datafile import DataFile, reset_default_data_paths
+
+# Submodules imported only when one of their names is first accessed (PEP 562), because they pull in dependencies
+# that many scripts never need (tabulate; sqlite3)
+_LAZY = {"rows2html": "htmlstuff", "tabulate_html": "htmlstuff", "row2html": "htmlstuff",
+         "FileSQLite": "filesqlite", "InvalidQuery": "filesqlite", "NoData": "filesqlite"}
+
+
+def __getattr__(name):
+    import importlib
+    if name in _LAZY:
+        ret = globals()[name] = getattr(importlib.import_module("."+_LAZY[name], __name__), name)
+        return ret
+    if name in _LAZY.values():
+        return importlib.import_module("."+name, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+del logging
+
+# same names as "from a107 import *" used to give, plus the lazy ones
+__all__ = [name for name in globals() if not name.startswith("_")]+list(_LAZY)
@@ -3,6 +3,8 @@ __all__ = ["asciichart"]
 from colored import attr
 import a107
 
+RESET = attr("reset")
+
 # TODO poor treatment of decimals (this is always a challenge)
 
 def asciichart(sequences, cfg=None, maxlines=100, legend=None, indent=0):
@@ -42,21 +44,10 @@ def asciichart(sequences, cfg=None, maxlines=100, legend=None, indent=0):
        -0.90  ┤                                     ╰╯
     """
 
-    def fix_asciichart(lines):
-        dotidx = max([line.index(".") for line in lines if "." in line])
-        lines_ = []
-        for line in lines:
-            try:
-                idx = line.index(".")
-                lines_.append(" "*(dotidx-idx)+line)
-            except ValueError:
-                lines_.append(line)
-        return "\n".join(lines_)
-
     def get_color(i):
         if "colors" not in cfg: return "", ""
         colors = cfg["colors"]
-        if i < len(colors): return colors[i], attr("reset")
+        if i < len(colors): return colors[i], RESET
         return "", ""
 
     def get_legendsymbol(i):
@@ -73,10 +64,9 @@ def asciichart(sequences, cfg=None, maxlines=100, legend=None, indent=0):
 
     text = plot(sequences, cfg)
 
-    lines = text.split("\n")
-    if len(lines) > maxlines:
+    # y-axis labels come out of plot() already aligned at the decimal point
+    if text.count("\n") >= maxlines:
         raise ValueError(f"Your chart has more than {maxlines} lines of text; maybe you would like to specify cfg['height']?")
-    text = fix_asciichart(lines)
     if legend is not None:
         ll = []
         for i, legend_i in enumerate(legend):
@@ -105,7 +95,8 @@ ascii chart from a series of numbers. The chart can be configured via several
 options to tune the output.
 """
 
-from math import ceil, floor, isnan
+from math import ceil, floor
+import numpy as np
 
 
 black = "\033[30m"
@@ -127,29 +118,73 @@ lightcyan = "\033[96m"
 white = "\033[97m"
 reset = "\033[0m"
 
-
-# __all__ = [
-#     'plot', 'black', 'red',
-#     'green', 'yellow', 'blue',
-#     'magenta', 'cyan', 'lightgray',
-#     'default', 'darkgray', 'lightred',
-#     'lightgreen', 'lightyellow', 'lightblue',
-#     'lightmagenta', 'lightcyan', 'white', 'reset',
-# ]
-
-# Python 3.2 has math.isfinite, which could have been used, but to support older
-# versions, this little helper is shorter than having to keep doing not isnan(),
-# plus the double-negative of "not is not a number" is confusing, so this should
-# help with readability.
-def _isnum(n):
-    return not isnan(n)
-
 def colored(char, color):
     if not color:
         return char
     else:
         return color + char + reset
 
+_DEFAULT_SYMBOLS = ('┼', '┤', '╶', '╴', '─', '╰', '╭', '╮', '╯', '│')
+
+
+def _format_axis(label, tick, offset):
+    """Returns the y-axis part of a chart row: label + tick mark, fit in offset columns (label may overflow)."""
+    pos = max(offset - len(label), 0)
+    if pos >= offset - 1:
+        # tick mark overwrites the label
+        return ' ' * (offset - 1) + tick
+    return ' ' * pos + label + ' ' * (offset - 2 - pos) + tick
+
+
+# Drawing routines. The grid receives integer codes (0: empty cell; code0+k: symbols[k] of the series being drawn),
+# which plot() maps to symbol strings afterwards. Within one series, each x writes to column x only, so the cells of
+# a series can be written all at once
+
+def _scale(data, minimum, maximum, ratio, min2):
+    """Converts series to row numbers (counted from the bottom of the chart); NaNs become -1."""
+    ret = np.full(len(data), -1, dtype=np.int64)
+    mask = ~np.isnan(data)
+    ret[mask] = np.rint(np.clip(data[mask], minimum, maximum) * ratio).astype(np.int64) - min2
+    return ret
+
+
+def _draw_line(grid, y, code0, rows):
+    """Draws series as a line using the 10-symbol set."""
+    x = np.arange(len(y) - 1)
+    y0, y1 = y[:-1], y[1:]
+    v0, v1 = y0 >= 0, y1 >= 0
+
+    m = ~v0 & v1
+    grid[rows - y1[m], x[m]] = code0 + 2
+    m = v0 & ~v1
+    grid[rows - y0[m], x[m]] = code0 + 3
+
+    both = v0 & v1
+    m = both & (y0 == y1)
+    grid[rows - y0[m], x[m]] = code0 + 4
+    m = both & (y0 > y1)
+    grid[rows - y1[m], x[m]] = code0 + 5
+    grid[rows - y0[m], x[m]] = code0 + 7
+    m = both & (y0 < y1)
+    grid[rows - y1[m], x[m]] = code0 + 6
+    grid[rows - y0[m], x[m]] = code0 + 8
+
+    # vertical fill strictly between y0 and y1
+    m = both & (np.abs(y1 - y0) > 1)
+    lengths = np.abs(y1[m] - y0[m]) - 1
+    if len(lengths):
+        starts = np.minimum(y0[m], y1[m]) + 1
+        ends = np.cumsum(lengths)
+        yfill = np.repeat(starts - (ends - lengths), lengths) + np.arange(ends[-1])
+        grid[rows - yfill, np.repeat(x[m], lengths)] = code0 + 9
+
+
+def _draw_symbol(grid, y, code0, rows):
+    """Draws series using a single symbol (will not plot 2x at the same column)."""
+    m = y >= 0
+    grid[rows - y[m], np.nonzero(m)[0]] = code0
+
+
 def plot(series, cfg=None):
     """Generate an ascii chart for a series of numbers.
 
@@ -222,20 +257,27 @@ def plot(series, cfg=None):
     if len(series) == 0:
         return ''
 
-    if not isinstance(series[0], list):
-        if all(isnan(n) for n in series):
-            return ''
-        else:
-            series = [series]
+    flag_single = not isinstance(series[0], list)
+    if flag_single:
+        series = [series]
+    elif len(series[0]) == 0:
+        return ''
+
+    # float64 copies of the series, also fed to the plotting kernels
+    data = [np.asarray(serie, dtype=np.float64) for serie in series]
+    flat = np.concatenate(data)
+    flat = flat[~np.isnan(flat)]
+    if flag_single and len(flat) == 0:
+        return ''
 
     cfg = cfg or {}
 
     colors = cfg.get('colors', [None])
 
-    minimum = cfg.get('min', min(filter(_isnum, [j for i in series for j in i])))
-    maximum = cfg.get('max', max(filter(_isnum, [j for i in series for j in i])))
+    minimum = cfg['min'] if 'min' in cfg else float(flat.min())
+    maximum = cfg['max'] if 'max' in cfg else float(flat.max())
 
-    default_symbols = ['┼', '┤', '╶', '╴', '─', '╰', '╭', '╮', '╯', '│']
+    default_symbols = _DEFAULT_SYMBOLS
     symbolss = cfg.get('symbols', [default_symbols])
 
     if minimum > maximum:
@@ -249,53 +291,41 @@ def plot(series, cfg=None):
     min2 = int(floor(minimum * ratio))
     max2 = int(ceil(maximum * ratio))
 
-    def clamp(n):
-        return min(max(n, minimum), maximum)
-
-    def scaled(y):
-        return int(round(clamp(y) * ratio) - min2)
-
     rows = max2 - min2
 
-    width = 0
-    for i in range(0, len(series)):
-        width = max(width, len(series[i]))
-    width += offset
-
-    result = [[' '] * width for i in range(rows + 1)]
+    width = max(len(serie) for serie in data)+offset
 
     # axis and labels
-    # placeholder = cfg.get('format', '{:8.2f} ')
-    # axissymbols = default_symbols
-    # for y in range(min2, max2 + 1):
-    #     label = placeholder.format(maximum - ((y - min2) * interval / (rows if rows else 1)))
-    #     result[y - min2][max(offset - len(label), 0)] = label
-    #     result[y - min2][offset - 1] = axissymbols[0] if y == 0 else axissymbols[1]  # zero tick mark
+    # (label values are calculated in one go, with the same operation order as maximum-(y-min2)*interval/rows)
+    values = (maximum - np.arange(rows + 1) * interval / (rows if rows else 1)).tolist()
     axissymbols = default_symbols
     if "format" in cfg:
         placeholder = cfg.get('format', '{:8.2f} ')
-        for y in range(min2, max2 + 1):
-            label = placeholder.format(maximum - ((y - min2) * interval / (rows if rows else 1)))
-            result[y - min2][max(offset - len(label), 0)] = label
-            result[y - min2][offset - 1] = axissymbols[0] if y == 0 else axissymbols[1]  # zero tick mark
+        labels = [placeholder.format(value) for value in values]
+        # aligns labels at the decimal point (or at the last digit, if there is no point)
+        dotposs = [label.find(".") if "." in label else len(label.rstrip()) for label in labels]
+        maxdotpos = max(dotposs)
+        labels = [" "*(maxdotpos-dotpos)+label for label, dotpos in zip(labels, dotposs)]
+        maxlen = max(len(label) for label in labels)
+        labels = [label.ljust(maxlen) for label in labels]
     else:
         maxsig = cfg.get("maxsig", 6)
-        labels = [a107.ffmt(maximum-((y-min2)*interval/(rows if rows else 1)), maxsig=maxsig)
-                  for y in range(min2, max2+1)]
+        labels = [a107.ffmt(value, maxsig=maxsig) for value in values]
         maxdotpos = max(_label.index(".") for _label in labels)
         labels = [" "*(maxdotpos-label.index("."))+label for label in labels]
         maxlen = max(len(label) for label in labels)
         labels = [label+"0"*(maxlen-len(label)) for label in labels]
-        for y, label in zip(range(min2, max2 + 1), labels):
-            result[y - min2][max(offset - len(label), 0)] = label
-            result[y - min2][offset - 1] = axissymbols[0] if y == 0 else axissymbols[1]  # zero tick mark
+    ticks = [axissymbols[0] if y == 0 else axissymbols[1] for y in range(min2, max2 + 1)]  # zero tick mark
 
+    ys = [_scale(serie, minimum, maximum, ratio, min2) for serie in data]
 
     # first value is a tick mark across the y-axis
-    d0 = series[0][0]
-    if _isnum(d0):
-        result[rows - scaled(d0)][offset - 1] = axissymbols[0]
+    y0 = ys[0][0]
+    if y0 >= 0:
+        ticks[rows - y0] = axissymbols[0]
 
+    grid = np.zeros((rows + 1, width - offset), dtype=np.int16)
+    table = [' ']  # code-to-string table, indexed by the grid codes
     for i in range(0, len(series)):
 
         color = colors[i % len(colors)]
@@ -304,45 +334,21 @@ def plot(series, cfg=None):
         if symbols is None: symbols = default_symbols
         flag_ss = len(symbols) == 1  # single symbol
 
-        # plot the line
-        if not flag_ss:
-            for x in range(0, len(series[i]) - 1):
-                d0 = series[i][x + 0]
-                d1 = series[i][x + 1]
-
-                if isnan(d0) and isnan(d1):
-                    continue
-
-                if isnan(d0) and _isnum(d1):
-                    result[rows - scaled(d1)][x + offset] = colored(symbols[2], color)
-                    continue
-
-                if _isnum(d0) and isnan(d1):
-                    result[rows - scaled(d0)][x + offset] = colored(symbols[3], color)
-                    continue
+        # colored variants are built once per series, not per pixel
+        # exactly 10 codes per series (longer symbol sets are truncated, as only the first 10 can be drawn)
+        csym = [colored(symbol, color) for symbol in symbols[:10]]
+        table.extend(csym+[' ']*(10-len(csym)))
 
-                y0 = scaled(d0)
-                y1 = scaled(d1)
-                if y0 == y1:
-                    result[rows - y0][x + offset] = colored(symbols[4], color)
-                    continue
+        draw = _draw_symbol if flag_ss else _draw_line
+        draw(grid, ys[i], i * 10 + 1, rows)
 
-                result[rows - y1][x + offset] = colored(symbols[5], color) if y0 > y1 else colored(symbols[6], color)
-                result[rows - y0][x + offset] = colored(symbols[7], color) if y0 > y1 else colored(symbols[8], color)
-
-                start = min(y0, y1) + 1
-                end = max(y0, y1)
-                for y in range(start, end):
-                    result[rows - y][x + offset] = colored(symbols[9], color)
-        else:
-            # single symbol will not plot 2x at the same column
-            for x in range(len(series[i])):
-                d = series[i][x]
-
-                if isnan(d):
-                    continue
-
-                result[rows-scaled(d)][x+offset] = colored(symbols[0], color)
+    if all(len(cell) == 1 for cell in table):
+        # Single-character cells (e.g. no colors): UCS4 canvas, each row is viewed as one string without copying
+        canvas = np.array(table)[grid]
+        rowstrs = canvas.view(f"<U{canvas.shape[1]}")[:, 0]
+    else:
+        rowstrs = [''.join(row) for row in np.array(table, dtype=object)[grid]]
 
-    return '\n'.join([''.join(row).rstrip() for row in result])
+    return '\n'.join([(_format_axis(label, tick, offset)+rowstr).rstrip()
+                      for label, tick, rowstr in zip(labels, ticks, rowstrs)])
 
@@ -5,6 +5,7 @@ Gear for working with configuration files
 """
 
 from configobj import ConfigObj
+from contextlib import contextmanager
 import os
 import a107
 
@@ -13,6 +14,9 @@ __all__ = ["AAConfigObj", "get_config_obj"]
 class AAConfigObj(ConfigObj):
     """Subclassed ConfigObj to create section structures automatically when getting/setting items"""
 
+    # set by batch()
+    _flag_batch = False
+
     def _get_section(self, path_):
         """Auto-creates section structure
 
@@ -71,12 +75,32 @@ class AAConfigObj(ConfigObj):
         
 
     def set(self, path_, value):
-        """Sets item and automatically saves file. Returns value for convenience"""
+        """Sets item and automatically saves file (unless inside batch()). Returns value for convenience"""
         section, path_ = self._get_section(path_)
         section[path_[-1]] = value
-        self.write()
+        if not self._flag_batch:
+            self.write()
         return value
 
+    @contextmanager
+    def batch(self):
+        """Context manager that saves file only once at exit, no matter how many items are set/defaulted inside.
+
+        Example:
+
+            with cfg.batch():
+                host = cfg.get("server/host", "localhost")
+                port = cfg.get("server/port", 8080)
+        """
+        flag_outer = not self._flag_batch
+        self._flag_batch = True
+        try:
+            yield self
+        finally:
+            if flag_outer:
+                self._flag_batch = False
+                self.write()
+
 
 def get_config_obj(filename):
     """Reads/creates filename at user **home** folder and returns a AAConfigObj object"""
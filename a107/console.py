@@ -3,7 +3,7 @@ Console class adapted from cliserv client+server.
 
 20210723 Good son returns home. Now there is serverlib.Console which made this deprecated.
 """
-import os, atexit, sys, signal, readline, re, csv, random, inspect, textwrap, a107
+import os, atexit, sys, signal, readline, re, random, inspect, textwrap, a107
 from colored import fg, bg, attr
 
 __all__ = ["ConsoleCommands", "Console", "ConsoleError", "console_bool", "embed_ipython"]
@@ -14,6 +14,15 @@ COLOR_EXCEPTION = fg("light_red")
 COLOR_HAPPY = fg("light_green")
 COLOR_SAD = fg("blue")
 COLOR_INPUT = fg("orange_1")
+BOLD = attr("bold")
+RESET = attr("reset")
+
+# 'methodname?' statement
+_HELP_RE = re.compile(r"(\w+)\?\Z")
+# statement token: "quoted" (with "" for a literal quote, possibly followed by more characters) or unquoted
+_TOKEN_RE = re.compile(r'"((?:[^"]|"")*)"?([^ ]*)|([^ ]+)')
+# shared by all _myprint() calls
+_WRAPPER = textwrap.TextWrapper(width=80)
 
 
 def console_bool(s):
@@ -30,6 +39,10 @@ class ConsoleCommands(object):
     arguments, as the Server is not capable of parsing them.
     """
 
+    # [(name, method), ...] and {name, ...} caches filled by _get_commands()
+    _commands = None
+    _command_names = None
+
     def __init__(self):
         self.console = None
 
@@ -50,16 +63,15 @@ class ConsoleCommands(object):
         '?' is an alias for 'help'.
         """
         if what is None:
-            mm = [x for x in inspect.getmembers(self, predicate=inspect.ismethod) if not x[0].startswith("_")]
+            mm = self._get_commands()
 
             lines = [self.console.slug, "="*len(self.console.slug), ""]
 
             if self.console.description:
                 lines += [self.console.description, ""]
 
-            maxlen = max([len(x[0]) for x in mm])
-            lines += ["{}{:>{}}{} -- {}".format(attr("bold"), name, maxlen, attr("reset"), a107.get_obj_doc0(method))
-                     for name, method in mm]
+            maxlen = max((len(name) for name, _ in mm), default=0)
+            lines.extend(f"{BOLD}{name:>{maxlen}}{RESET} -- {a107.get_obj_doc0(method)}" for name, method in mm)
 
             return "\n".join(lines)
 
@@ -69,7 +81,7 @@ class ConsoleCommands(object):
 
             method = self.__getattribute__(what)
             sig = str(inspect.signature(method)).replace("(", "").replace(")", "").replace(",", "")
-            return "{}{} {}{}\n\n{}".format(attr("bold"), what, sig, attr("reset"), method.__doc__)
+            return "{}{} {}{}\n\n{}".format(BOLD, what, sig, RESET, method.__doc__)
 
     def ping(self):
         """Returns "pong"."""
@@ -90,11 +102,23 @@ class ConsoleCommands(object):
     def _get_welcome(self):
         return "\n".join(a107.format_slug(self._get_welcome0(), random.randint(0, 2)))
 
-    def __get_command_names(self):
-        """Return the names of the commands the the console can execute."""
+    def _get_commands(self):
+        """Returns [(name, method), ...] for the commands the console can execute (inspected only once)."""
+        if self._commands is None:
+            self._commands = [x for x in inspect.getmembers(self, predicate=inspect.ismethod)
+                              if not x[0].startswith("_")]
+            self._command_names = frozenset(x[0] for x in self._commands)
+        return self._commands
 
-        return [x[0] for x in inspect.getmembers(self, predicate=inspect.ismethod) if
-              not x[0].startswith("_")]
+    def _invalidate_commands(self):
+        """Drops the cached commands (see Console.refresh_commands(); not public here, as it would become a command)."""
+        self._commands = self._command_names = None
+
+    def __get_command_names(self):
+        """Return the set of names of the commands the the console can execute."""
+        if self._command_names is None:
+            self._get_commands()
+        return self._command_names
 
 
 class Console(object):
@@ -153,38 +177,59 @@ class Console(object):
     def exit(self):
         self.running = False
 
+    def refresh_commands(self):
+        """Re-inspects self.cmd for commands. Call this after adding/removing command methods at runtime.
+
+        The list of commands is inspected only once and then cached, as it is looked up for every statement.
+        """
+        self.cmd._invalidate_commands()
+
     def run(self):
         """Will run console and automatically exit the program.
 
         Exits because it registers handlers to intercept Ctrl+C and Ctrl+Z.
+
+        If stdin is not a terminal (e.g. commands piped in), runs in script mode: reads statements
+        until end-of-file, without history, prompt, welcome banner or yoda lines.
         """
 
-        # This one gets called at Ctrl+C, but ...
-        def _atexit():
-            readline.write_history_file(self.historypath)
+        interactive = sys.stdin.isatty()
 
-        # ... we need this to handle the Ctrl+Z.
-        def _ctrl_z_handler(signum, frame):
-            # this will trigger _atexit()
-            sys.exit()
+        if interactive:
+            # This one gets called at Ctrl+C, but ...
+            atexit.register(readline.write_history_file, self.historypath)
 
-        atexit.register(_atexit)
-        signal.signal(signal.SIGTSTP, _ctrl_z_handler)
+            # ... we need this to handle the Ctrl+Z.
+            def _ctrl_z_handler(signum, frame):
+                # this will trigger the history writing registered above
+                sys.exit()
 
-        try:
-            readline.read_history_file(self.historypath)
-            # default history len is -1 (infinite), which may grow unruly
+            signal.signal(signal.SIGTSTP, _ctrl_z_handler)
+
+            # default history len is -1 (infinite), which may grow unruly. Set before reading so that the
+            # file gets truncated at every write even if it did not exist yet, keeping the next read short
             readline.set_history_length(1000)
-        except FileNotFoundError:
-            pass
+            try:
+                readline.read_history_file(self.historypath)
+            except FileNotFoundError:
+                pass
 
-        print(self.execute("_get_welcome"))
+        import tabulate
+        if interactive:
+            print(self.execute("_get_welcome"))
+            prompt = f"{COLOR_INPUT}{BOLD}{self.slug}>"
 
         try:
             self.running = True
             while self.running:
-                st = input("{}{}{}>".format(COLOR_INPUT, attr("bold"), self.slug))
-                print(attr("reset"), end="")
+                if interactive:
+                    st = input(prompt)
+                    sys.stdout.write(RESET)
+                else:
+                    st = sys.stdin.readline()
+                    if not st:
+                        break
+                    st = st.rstrip("\n")
 
                 if not st:
                     pass
@@ -192,9 +237,9 @@ class Console(object):
                     _yoda("Use the force.")
                 else:
                     try:
-                        import tabulate
                         ret = self.execute(st)
-                        _yoda("Happy I am.", True)
+                        if interactive:
+                            _yoda("Happy I am.", True)
                         prdef = False
                         if ret is None:
                             pass
@@ -209,7 +254,8 @@ class Console(object):
                         if prdef:
                             _myprint(ret)
                     except BaseException as e:
-                        _yoda("That work did not.", False)
+                        if interactive:
+                            _yoda("That work did not.", False)
                         _my_print_exception(e)
         except KeyboardInterrupt:
             pass
@@ -234,14 +280,9 @@ class Console(object):
         """
 
         if _st == "?":
-            st = "help"
-        else:
-            gg = re.match("(\w+)\?$", _st)
-            if gg is not None:
-                st = 'help "{}"'.format(gg[1])
-            else:
-                st = _st
-        return st
+            return "help"
+        m = _HELP_RE.match(_st)
+        return f'help "{m[1]}"' if m else _st
 
     def __process_statement(self, st):
         """Parses statement and makes method call.
@@ -250,8 +291,7 @@ class Console(object):
             st: bytes
         """
         try:
-            reader = csv.reader([st], delimiter=" ", skipinitialspace=True)
-            parts = [[x.strip() for x in row] for row in reader][0]
+            parts = _split_statement(st) or [""]
             name = parts[0]
 
             try:
@@ -262,8 +302,7 @@ class Console(object):
                 ret = self._process_invalid_method(parts)
             else:
                 # Some basic conversion
-                parts_ = [None if x == "None" else x for x in parts]
-                ret = method(*parts_[1:])
+                ret = method(*[None if x == "None" else x for x in parts[1:]])
 
 
 
@@ -275,15 +314,22 @@ class Console(object):
 
         return ret
 
+def _split_statement(st):
+    """Splits statement at spaces, respecting double quotes (same rules as the csv module used to apply)."""
+    return [(m[1].replace('""', '"')+m[2] if m[3] is None else m[3]).strip() for m in _TOKEN_RE.finditer(st)]
+
+
+_YODA_HAPPY = f"{BOLD}{COLOR_HAPPY}^|o_o|^ -- "
+_YODA_SAD = f"{BOLD}{COLOR_SAD}v|o_o|v -- "
+_YODA_END = f"{RESET}{RESET}\n"
+
+
 def _yoda(s, happy=True):
-    print(attr("bold")+(COLOR_HAPPY if happy else COLOR_SAD), end="")
-    print("{0}|o_o|{0} -- {1}".format("^" if happy else "v", s), end="")
-    print(attr("reset")*2)
+    sys.stdout.write(f"{_YODA_HAPPY if happy else _YODA_SAD}{s}{_YODA_END}")
 
 
 def _my_print_exception(e):
-    print("{}{}({}){}{} {}{}".format(COLOR_EXCEPTION, attr("bold"), e.__class__.__name__,
-                                     attr("reset"), COLOR_EXCEPTION, str(e), attr("reset")))
+    sys.stdout.write(f"{COLOR_EXCEPTION}{BOLD}({e.__class__.__name__}){RESET}{COLOR_EXCEPTION} {e}{RESET}\n")
 
 def _myprint(x):
     """Used to print results from client statements.
@@ -293,9 +339,8 @@ def _myprint(x):
 
     if not isinstance(x, str):
         x = repr(x)
-    x = x.replace("\n", "")
-    x = re.sub(r'\s+', ' ', x)
-    print("\n".join(textwrap.wrap(x, 80)))
+    x = " ".join(x.replace("\n", "").split())
+    print("\n".join(_WRAPPER.wrap(x)))
 
 
 class ConsoleError(Exception):
@@ -336,19 +381,16 @@ def embed_ipython(commands, globalsdict, colors="linux"):
         print(commands.help(command))
     # globalsdict["print_help"] = print_help
 
-    mm = [x for x in inspect.getmembers(commands, predicate=inspect.ismethod) if not x[0].startswith("_")]
-    for name, method in mm:
-        globalsdict[name] = method
-    # del Commands, method, mm  # , console
+    globalsdict.update(commands._get_commands())
 
     def _ctrl_z_handler(signum, frame):
         # this will trigger _atexit()
         print(a107.format_yoda('Press Ctrl+Z do not, type "exit" you must'))
 
         # atexit.register(on_exit)  # _atexit)
-    signal.signal(signal.SIGTSTP, _ctrl_z_handler)
+    if sys.stdin.isatty():
+        signal.signal(signal.SIGTSTP, _ctrl_z_handler)
 
-    del mm, name, method
     locals().update(globalsdict)
 
     # I inspected the source code for embed() and saw that "autoawait" (which I want to be true) is conditioned to
@@ -4,12 +4,12 @@ Note: date- and time- related conversion routines are in the datetimefunc module
 """
 
 __all__ = [
-"str2bool", "to_bool", "bool2str", "chunk_string", "ordinal_suffix", "seconds2str",
-"module2dict", "unicode2greek",
-"greek2unicode", "make_code_readable", "int2superscript", "color2hex", "hex2color",
+"str2bool", "to_bool", "bool2str", "chunk_string", "chunk_string_list", "chunk_bytes", "ordinal_suffix",
+"seconds2str", "module2dict", "unicode2greek", "greek2unicode", "unicode2greek_bulk", "greek2unicode_bulk",
+"make_code_readable", "int2superscript", "color2hex", "hex2color",
 "rowsheader2dictlist", "ffmt", "smartfloat", "sorp", "split_cell", "join_cell"]
 
-import math, re, csv, io
+import math, re, csv, io, functools
 
 
 def rowsheader2dictlist(rows, header):
@@ -22,10 +22,8 @@ def rowsheader2dictlist(rows, header):
      {'Id': 4, 'Name': 'Graham'},
      {'Id': 5, 'Name': 'Michael'}]
     """
-    ret = []
-    for row in rows:
-        ret.append({key: value for key, value in zip(header, row)})
-    return ret
+    header = tuple(header)
+    return [dict(zip(header, row)) for row in rows]
 
 
 def color2hex(color, flag_lowercase=True):
@@ -43,17 +41,25 @@ def color2hex(color, flag_lowercase=True):
 
     to_int_and_clamp = lambda x: max(0, min(int(x*255 if isinstance(x, float) and x <= 1 else x), 255))
 
-    ret = ("".join([f"{to_int_and_clamp(x):02x}" for x in color]))
+    ret = bytes([to_int_and_clamp(x) for x in color]).hex()
     if not flag_lowercase:
         ret = ret.upper()
     return ret
 
 
+@functools.lru_cache(maxsize=512)
 def hex2color(hhhhhh):
     """Transform every 2 digits of hhhhhh into an integer in [0, 255] and returns a tuple with these integers."""
     if hhhhhh[0] == "#":
         hhhhhh = hhhhhh[1:]
-    return tuple([int(hhhhhh[i:i+2], 16) for i in range(0, len(hhhhhh), 2)])
+    try:
+        return tuple(bytes.fromhex(hhhhhh))
+    except ValueError:
+        # e.g. odd number of digits: last number has one digit only
+        return tuple([int(hhhhhh[i:i+2], 16) for i in range(0, len(hhhhhh), 2)])
+
+
+_STR2BOOL = {"T": True, "F": False}
 
 
 def str2bool(s):
@@ -61,11 +67,13 @@ def str2bool(s):
 
     **Note** This routine is limited on purpose for speed.
     """
-    if s == "T":
-        return True
-    elif s == "F":
-        return False
-    raise ValueError("I don't understand '{0!s}' as a logical value".format(s))
+    try:
+        return _STR2BOOL[s]
+    except (KeyError, TypeError):
+        raise ValueError("I don't understand '{0!s}' as a logical value".format(s)) from None
+
+
+_TO_BOOL = {"T": True, "TRUE": True, "ON": True, "1": True, "F": False, "FALSE": False, "OFF": False, "0": False}
 
 
 def to_bool(s):
@@ -74,12 +82,17 @@ def to_bool(s):
         return s
     if isinstance(s, (int, float)):
         return s != 0
+    if len(s) == 1:
+        # most common case, no need for upper()
+        if s in "Tt1":
+            return True
+        if s in "Ff0":
+            return False
     s = s.upper()
-    if s in ("T", "TRUE", "ON", "1"):
-        return True
-    elif s in ("F", "FALSE", "OFF", "0"):
-        return False
-    raise ValueError("I don't understand '{0!s}' as a logical value".format(s))
+    try:
+        return _TO_BOOL[s]
+    except KeyError:
+        raise ValueError("I don't understand '{0!s}' as a logical value".format(s)) from None
 
 
 def bool2str(x):
@@ -87,8 +100,17 @@ def bool2str(x):
 
     **Note** This routine is limited on purpose for speed.
     """
-    assert isinstance(x, bool)
-    return "T" if x else "F"
+    if x is True:
+        return "T"
+    if x is False:
+        return "F"
+    raise TypeError(f"bool expected, not {x.__class__.__name__}")
+
+
+# make_code_readable() stuff: escapes are dropped; string literals are copied as they are
+_CODE_ESCAPE_RE = re.compile(r"\\.?", re.S)
+_CODE_TOKEN_RE = re.compile(r"'[^']*'?|\"[^\"]*\"?|[,{}]")
+_CODE_MAP = {",": ",\n", "{": "{\n ", "}": "\n}"}
 
 
 def make_code_readable(s):
@@ -102,42 +124,8 @@ def make_code_readable(s):
     """
 
     s = s if isinstance(s, str) else str(s)
-
-    MAP = {",": ",\n", "{": "{\n ", "}": "\n}"}
-
-    ll = []
-
-    state = "open"
-    flag_single = False
-    flag_double = False
-    flag_backslash = False
-    for ch in s:
-        if flag_backslash:
-            flag_backslash = False
-            continue
-
-        if ch == "\\":
-            flag_backslash = True
-            continue
-
-        if flag_single:
-            if ch == "'":
-                flag_single = False
-        elif not flag_double and ch == "'":
-            flag_single = True
-
-        if flag_double:
-            if ch == '"':
-                flag_double = False
-        elif not flag_single and ch == '"':
-            flag_double = True
-
-        if flag_single or flag_double:
-            ll.append(ch)
-        else:
-            ll.append(MAP.get(ch, ch))
-
-    return "".join(ll)
+    s = _CODE_ESCAPE_RE.sub("", s)
+    return _CODE_TOKEN_RE.sub(lambda m: _CODE_MAP.get(m[0], m[0]), s)
 
 
 def chunk_string(string, length):
@@ -154,31 +142,52 @@ def chunk_string(string, length):
     return (string[0 + i:length + i] for i in range(0, len(string), length))
 
 
+def chunk_string_list(string, length):
+    """List version of chunk_string(), faster when all chunks are needed at once."""
+    return [string[i:i+length] for i in range(0, len(string), length)]
+
+
+def chunk_bytes(buf, length):
+    """
+    Splits a bytes-like object into fixed-length chunks without copying.
+
+    Same as chunk_string(), but yields memoryview slices of buf. Use bytes(chunk) where a copy is
+    actually needed.
+    """
+    mv = memoryview(buf)
+    return (mv[i:i+length] for i in range(0, len(mv), length))
+
+
+# suffixes for i % 100
+_ORDINAL_SUFFIXES = tuple("th" if 10 <= n <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th") for n in range(100))
+
+
 def ordinal_suffix(i):
-    """Returns 'st', 'nd', or 'rd'."""
-    v = str(i)
-    return "st" if v.endswith("1") \
-            else "nd" if v.endswith("2") else "rd" if v.endswith("3") else "th"
+    """Returns 'st', 'nd', 'rd' or 'th' for integer i, e.g., 1st, 12th, 22nd, 113th.
+
+    i may also be anything int() accepts, e.g., "22" or 3.0.
+    """
+    return _ORDINAL_SUFFIXES[abs(int(i)) % 100]
 
 
 def seconds2str(seconds):
     """Returns string such as 1h 05m 55s."""
 
-    if seconds < 0:
-        return "{0:.3g}s".format(seconds)
-    elif math.isnan(seconds):
-        return "NaN"
-    elif math.isinf(seconds):
-        return "Inf"
+    # single test for the common case; NaN fails both comparisons
+    if not 0 <= seconds < math.inf:
+        if seconds != seconds:
+            return "NaN"
+        if seconds == math.inf:
+            return "Inf"
+        return f"{seconds:.3g}s"
 
     m, s = divmod(seconds, 60)
+    if m < 1:
+        return f"{s:.3g}s"
     h, m = divmod(m, 60)
     if h >= 1:
-        return "{0:g}h {1:02g}m {2:.3g}s".format(h, m, s)
-    elif m >= 1:
-        return "{0:02g}m {1:.3g}s".format(m, s)
-    else:
-        return "{0:.3g}s".format(s)
+        return f"{h:g}h {m:02g}m {s:.3g}s"
+    return f"{m:02g}m {s:.3g}s"
 
 
 def module2dict(module):
@@ -202,100 +211,52 @@ def module2dict(module):
 #     "A Python dictionary mapping the Unicode codes of the greek alphabet to their names"
 #     https://gist.github.com/beniwohli/765262
 #
-_UNICODE_GREEK = (
-('\u0391', 'Alpha'),
-('\u0392', 'Beta'),
-('\u0393', 'Gamma'),
-('\u0394', 'Delta'),
-('\u0395', 'Epsilon'),
-('\u0396', 'Zeta'),
-('\u0397', 'Eta'),
-('\u0398', 'Theta'),
-('\u0399', 'Iota'),
-('\u039A', 'Kappa'),
-('\u039B', 'Lamda'),
-('\u039C', 'Mu'),
-('\u039D', 'Nu'),
-('\u039E', 'Xi'),
-('\u039F', 'Omicron'),
-('\u03A0', 'Pi'),
-('\u03A1', 'Rho'),
-('\u03A3', 'Sigma'),
-('\u03A4', 'Tau'),
-('\u03A5', 'Upsilon'),
-('\u03A6', 'Phi'),
-('\u03A7', 'Chi'),
-('\u03A8', 'Psi'),
-('\u03A9', 'Omega'),
-('\u03B1', 'alpha'),
-('\u03B2', 'beta'),
-('\u03B3', 'gamma'),
-('\u03B4', 'delta'),
-('\u03B5', 'epsilon'),
-('\u03B6', 'zeta'),
-('\u03B7', 'eta'),
-('\u03B8', 'theta'),
-('\u03B9', 'iota'),
-('\u03BA', 'kappa'),
-('\u03BB', 'lamda'),
-('\u03BC', 'mu'),
-('\u03BD', 'nu'),
-('\u03BE', 'xi'),
-('\u03BF', 'omicron'),
-('\u03C0', 'pi'),
-('\u03C1', 'rho'),
-('\u03C3', 'sigma'),
-('\u03C4', 'tau'),
-('\u03C5', 'upsilon'),
-('\u03C6', 'phi'),
-('\u03C7', 'chi'),
-('\u03C8', 'psi'),
-('\u03C9', 'omega'),
-)
-
-_UNICODE2GREEK = dict(_UNICODE_GREEK)
-_GREEK2UNICODE = dict([(x[1], x[0]) for x in _UNICODE_GREEK])
+# Capital letters are '\u0391' (Alpha) to '\u03A9' (Omega), skipping '\u03A2' (there is no capital final sigma);
+# small letters are the capitals + 0x20
+_GREEK_NAMES = ("Alpha Beta Gamma Delta Epsilon Zeta Eta Theta Iota Kappa Lamda Mu Nu Xi Omicron Pi Rho "
+                "Sigma Tau Upsilon Phi Chi Psi Omega").split()
+_UNICODE2GREEK = {}
+for _i, _name in enumerate(_GREEK_NAMES):
+    _UNICODE2GREEK[chr(0x0391+_i+(_i >= 17))] = _name
+for _i, _name in enumerate(_GREEK_NAMES):
+    _UNICODE2GREEK[chr(0x03B1+_i+(_i >= 17))] = _name.lower()
+del _i, _name
+_GREEK2UNICODE = {v: k for k, v in _UNICODE2GREEK.items()}
+# for the *_bulk() routines
+_UNICODE2GREEK_TABLE = str.maketrans(_UNICODE2GREEK)
+_GREEK_NAME_RE = re.compile(r"\b(?:{})\b".format("|".join(sorted(_GREEK2UNICODE, key=len, reverse=True))))
+# "?" is the "zero-element" of the scalar routines
+_UNICODE2GREEK["?"] = _GREEK2UNICODE["?"] = "?"
 
 
 def unicode2greek(s):
     """Converts unicode single code, e.g., '\u03A3' to Greek letter name, e.g. 'Sigma'"""
-
-    # "?" is the "zero-element"
-    if s == "?":
-        return s
-
     return _UNICODE2GREEK[s]
 
 
 def greek2unicode(s):
     """Converts Greek letter name, e.g., 'Sigma', to unicode character, e.g. '\u03A3' """
+    return _GREEK2UNICODE[s]
 
-    # "?" is the "zero-element"
-    if s == "?":
-        return s
 
-    return _GREEK2UNICODE[s]
+def unicode2greek_bulk(s):
+    """Replaces all Greek unicode characters in s by their names, e.g., '\u03A3=1' --> 'Sigma=1'"""
+    return s.translate(_UNICODE2GREEK_TABLE)
+
+
+def greek2unicode_bulk(s):
+    """Replaces all whole-word Greek letter names in s by unicode characters, e.g., 'Sigma=1' --> '\u03A3=1'"""
+    return _GREEK_NAME_RE.sub(lambda m: _GREEK2UNICODE[m[0]], s)
 
 
 # superscript numbers
-_INT_TO_SUPERSCRIPT = {
- 0: "\u2070",
- 1: "\u2071",
- 2: "\u00b2",
- 3: "\u00b3",
- 4: "\u2074",
- 5: "\u2075",
- 6: "\u2076",
- 7: "\u2077",
- 8: "\u2078",
- 9: "\u2079",
-}
+_SUPERSCRIPT_TABLE = str.maketrans("0123456789", "\u2070\u00b9\u00b2\u00b3\u2074\u2075\u2076\u2077\u2078\u2079")
 
 
 def int2superscript(i):
     """int2superscript(i) --> str"""
 
-    return "".join((_INT_TO_SUPERSCRIPT[int(ch)] for ch in str(i)))
+    return str(i).translate(_SUPERSCRIPT_TABLE)
 
 
 #-----------------------------------------------------------------------------------------------------------------------
@@ -3,9 +3,9 @@ Ancestor class for all classes that represent a file type with load/save/init fe
 
 20230907 Based on f311, then f312, then I decided to incorporate this into a107
 """
-__all__ = ["DataFile"]
+__all__ = ["DataFile", "reset_default_data_paths"]
 
-import os, a107, shutil, sys
+import os, a107, shutil, sys, functools
 
 class DataFile(a107.AttrsPart):
     """
@@ -129,11 +129,21 @@ def _get_default_data_path(*args, class_=None):
         flag_raise: raises error if file is not found. This can be turned off for whichever purpose
     """
 
-    pkgname =  class_.__module__
+    return _resolve_default_data_path(class_.__module__, class_.__name__, args)
+
+
+def reset_default_data_paths():
+    """Forgets resolved default data file paths. Call this if default data files are added/moved at runtime."""
+    _resolve_default_data_path.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_default_data_path(pkgname, classname, args):
+    """Cached part of _get_default_data_path() (see reset_default_data_paths())."""
     mseq = pkgname.split(".")
     if len(mseq) < 2 or mseq[1] != "filetypes":
         raise ValueError("Invalid module name for class '{}': '{}' "
-                         "(must be '(...).filetypes[.(...)]')".format(class_.__name__, pkgname))
+                         "(must be '(...).filetypes[.(...)]')".format(classname, pkgname))
     # gets "root" module object
     # For example, if pkgname is "pyfant.filetypes.filemain", module below will be
     # the "pyfant" module object
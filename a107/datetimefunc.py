@@ -4,11 +4,11 @@ In 20210528, I added ts and tzinfo options to all methods that convert to dateti
 
 
 """
-import math, datetime, dateutil.parser, numpy as np
+import datetime, functools, re, time, dateutil.parser, numpy as np
 
 __all__ = ["now_str", "date2datetime", "dt2ts", "ts2dt", "dt2str", "str2dt", "ts2str",
-           "time2seconds", "seconds2time", "to_datetime", "str2ts", "iso8601_to_float",
-           "float_to_iso8601", "dt2slug", "v_ts2dt", "to_timestamp", "tzinfo_tz", "utc",
+           "time2seconds", "seconds2time", "v_time2seconds", "v_seconds2time", "to_datetime", "str2ts",
+           "iso8601_to_float", "float_to_iso8601", "dt2slug", "v_ts2dt", "v_ts2dt64", "to_timestamp", "tzinfo_tz", "utc",
            "now_ts", "ts_now", "to_ts_utc", "human2ts"]
 
 utc = datetime.timezone.utc
@@ -19,12 +19,19 @@ _FMT0 = "%Y-%m-%d"  # Date format only
 _FMT1 = "%Y%m%d" # Date format, compacted
 _FMTSTAMP = "%Y.%m.%d.%H.%M.%S"  # Format for dates and times that will be parts of filenames
 
+# Bound once to save the attribute lookups in functions that get called per row/log line
+_now = datetime.datetime.now
+_fromtimestamp = datetime.datetime.fromtimestamp
+_strptime = datetime.datetime.strptime
+_fromisoformat = datetime.datetime.fromisoformat
+
 
 def now_str(tz=None):
-    return datetime.datetime.strftime(datetime.datetime.now(tz), _FMTS)
+    return _now(tz).strftime(_FMTS)
 
 def ts_now():
-    return dt2ts(datetime.datetime.now())
+    # same as dt2ts(datetime.datetime.now()), without creating the datetime
+    return time.time()
 
 # #compatibility
 now_ts = ts_now
@@ -91,13 +98,25 @@ def ts2dt(ts, tz=None):
         >>> a107.ts2dt(0, datetime.timezone.utc)
         datetime.datetime(1970, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
     """
-    ret = datetime.datetime.fromtimestamp(ts)
-    if tz is not None: ret = ret.astimezone(tz)
+    # Passing tz converts straight from the timestamp instead of going through naive local time first
+    return _fromtimestamp(ts, tz)
+
+
+def v_ts2dt(ts, tz=None):
+    """Vectorized version of ts2dt(): returns object array of datetime.datetime shaped like ts."""
+    ts = np.asarray(ts)
+    ret = np.empty(ts.shape, dtype=object)
+    # fromtimestamp(x, tz) is the same as fromtimestamp(x).astimezone(tz)
+    ret.flat[:] = [_fromtimestamp(x, tz) for x in ts.ravel().tolist()]
     return ret
 
 
-v_ts2dt = np.vectorize(ts2dt)
-v_ts2dt.__doc__ = """Vectorized version of ts2dt()"""
+def v_ts2dt64(ts):
+    """Converts timestamps to numpy datetime64[us] array entirely within numpy.
+
+    Unlike v_ts2dt(), values represent **UTC** time (datetime64 has no timezone), e.g., 0 --> 1970-01-01T00:00:00
+    """
+    return np.rint(np.asarray(ts, dtype=np.float64)*1e6).astype(np.int64).astype("datetime64[us]")
 
 
 def dt2str(dt, flagSeconds=True):
@@ -124,7 +143,7 @@ def dt2slug(dt=None):
         '2022.01.06.10.03.59'
     """
     if dt is None:
-        dt = datetime.datetime.now()
+        dt = _now()
     return dt.strftime(_FMTSTAMP if isinstance(dt, datetime.datetime) else _FMT1)
 
 
@@ -135,7 +154,35 @@ def str2dt(s, tzinfo=None):
         s:
         tzinfo:
     """
-    if len(s) == 8:
+    ret = _str2dt(s)
+    if tzinfo is not None:
+        ret = ret.replace(tzinfo=tzinfo)
+    return ret
+
+
+# "%Y-%m-%d", "%Y-%m-%d %H:%M" or "%Y-%m-%d %H:%M:%S", all zero-padded
+_ISO_SHAPE_RE = re.compile(r"\d{4}-\d\d-\d\d(?: \d\d:\d\d(?::\d\d)?)?\Z", re.ASCII)
+
+
+# "YYYY-MM-DD[THH:MM[:SS[.ffffff]][Z|+HH:MM]]"
+_ISO_DATETIME_RE = re.compile(r"\d{4}-\d\d-\d\d(?:[T ]\d\d:\d\d(?::\d\d(?:\.\d{1,6})?)?(?:Z|[+-]\d\d:\d\d)?)?\Z",
+                              re.ASCII)
+
+
+# Date strings read from files tend to repeat a lot; datetime objects are immutable, so it is safe to share them
+@functools.lru_cache(maxsize=4096)
+def _str2dt(s):
+    """Cached, timezone-naive part of str2dt()."""
+    # zero-padded strings (the ones produced by dt2str()) are valid ISO 8601, which datetime.fromisoformat() parses much
+    # faster than strptime(); only exactly these shapes are sent there, as fromisoformat() accepts more than strptime()
+    if _ISO_SHAPE_RE.match(s):
+        try:
+            return _fromisoformat(s)
+        except ValueError:
+            # let strptime() have the final word
+            pass
+    n = len(s)
+    if n == 8:
         fmt = _FMT1
     elif s.count(":") == 2:
         fmt = _FMTS
@@ -143,10 +190,7 @@ def str2dt(s, tzinfo=None):
         fmt = _FMT
     else:
         fmt = _FMT0
-    ret = datetime.datetime.strptime(s, fmt)
-    if tzinfo is not None:
-        ret = ret.replace(tzinfo=tzinfo)
-    return ret
+    return _strptime(s, fmt)
 
 
 def ts2str(s, flagSeconds: bool = True, tz=None):
@@ -224,6 +268,14 @@ def to_ts_utc(arg):
 
 
 def iso8601_to_float(s):
+    # fast path for the common, strict shape only, as fromisoformat() accepts things (e.g., week dates) that dateutil
+    # rejects or reads differently
+    if _ISO_DATETIME_RE.match(s):
+        try:
+            # before Python 3.11, fromisoformat() does not understand "Z"
+            return _fromisoformat(s[:-1]+"+00:00" if s.endswith("Z") else s).timestamp()
+        except ValueError:
+            pass
     return dateutil.parser.parse(s).timestamp()
 
 
@@ -233,13 +285,28 @@ def float_to_iso8601(w):
 
 def time2seconds(t):
     """Returns seconds since 0h00."""
-    return t.hour * 3600 + t.minute * 60 + t.second + float(t.microsecond) / 1e6
+    return t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1e6
 
 
 def seconds2time(s):
     """Inverse of time2seconds()."""
-    hour, temp = divmod(s, 3600)
-    minute, temp = divmod(temp, 60)
-    temp, second = math.modf(temp)
-    return datetime.time(hour=int(hour), minute=int(minute), second=int(second),
-                         microsecond=int(round(temp * 1e6)))
+    # works on integer microseconds all the way
+    microsecond = round(float(s)*1e6)
+    hour, microsecond = divmod(microsecond, 3600000000)
+    minute, microsecond = divmod(microsecond, 60000000)
+    second, microsecond = divmod(microsecond, 1000000)
+    return datetime.time(hour=hour, minute=minute, second=second, microsecond=microsecond)
+
+
+def v_time2seconds(hour, minute, second, microsecond=0):
+    """Vectorized version of time2seconds() taking the time fields as (arrays of) numbers."""
+    return np.asarray(hour)*3600+np.asarray(minute)*60+np.asarray(second)+np.asarray(microsecond)/1e6
+
+
+def v_seconds2time(s):
+    """Vectorized inverse of v_time2seconds(): returns int64 arrays (hour, minute, second, microsecond)."""
+    microsecond = np.rint(np.asarray(s, dtype=np.float64)*1e6).astype(np.int64)
+    hour, microsecond = np.divmod(microsecond, 3600000000)
+    minute, microsecond = np.divmod(microsecond, 60000000)
+    second, microsecond = np.divmod(microsecond, 1000000)
+    return hour, minute, second, microsecond
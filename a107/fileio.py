@@ -2,22 +2,23 @@ import collections
 import os.path
 import re
 import shutil
-from threading import Lock
-import sys
+import stat
 import a107
 import logging
-import glob
 
 
 __all__ = [
     "rename_to_temp", "is_text_file", "add_bits_to_path", "add_parts_to_path", "crunch_dir",
-    "slugify", "write_lf", "get_path", "new_filename", "temp_filename", "sequential_filename", "create_symlink", "which",
+    "slugify", "write_lf", "write_lines", "get_path", "new_filename", "temp_filename", "sequential_filename", "create_symlink", "which",
     "ensure_path", "open_html", "sequential_filename_with_dateslug"
 ]
 
 
 # # Filename or pathname-related string manipulations
 
+_SLUGIFY_RE = re.compile(r'[^\w .-]')
+
+
 def slugify(string):
     """
     Removes non-alpha characters, and converts spaces to hyphens. Useful for making file names.
@@ -25,9 +26,7 @@ def slugify(string):
 
     Source: http://stackoverflow.com/questions/5574042/string-slugification-in-python
     """
-    string = re.sub('[^\w .-]', '', string)
-    string = string.replace(" ", "-")
-    return string
+    return _SLUGIFY_RE.sub('', string).replace(" ", "-")
 
 
 def crunch_dir(name, n=50):
@@ -95,36 +94,44 @@ def new_filename(prefix, extension=None, flag_minimal=True):
     If flag_minimal were True, it would skip the first attempt.
     """
 
+    existing = None
+    for ret in _iter_new_filenames(prefix, extension, flag_minimal):
+        # Names in the listing are taken; any other name is confirmed with stat(), which is exact also on
+        # case-insensitive filesystems and for files created after the listing
+        if existing is not None and os.path.basename(ret) in existing:
+            continue
+        if not os.path.exists(ret):
+            return ret
+        if existing is None:
+            existing = _list_names(os.path.dirname(ret))
+
+
+def _list_names(dir_):
+    """Returns set of names in directory (empty set if it cannot be listed)."""
+    try:
+        return set(os.listdir(dir_ or "."))
+    except OSError:
+        return set()
+
+
+def _iter_new_filenames(prefix, extension, flag_minimal):
+    """Yields the candidate names tried by new_filename(); raises RuntimeError when they run out."""
     if extension is None:
         extension = ""
 
-    if len(extension) > 0 and extension[0] == '.':
+    if extension.startswith('.'):
         extension = extension[1:]
+    dot_extension = "."+extension if extension else ""
 
-    # extension-sensitive format for filename
-    fmt = '{0!s}-{1:04d}.{2!s}' if extension else '{0!s}-{1:04d}'
-
-    # Removes tailing dash because it would look funny (but will be re-added in format string)
+    # Removes tailing dash because it would look funny (but will be re-added in template)
     prefix_ = prefix[:-1] if prefix.endswith("-") else prefix
 
-    i = -1
-    ret = None
-    while True:
-        if i == -1:
-            if flag_minimal:
-                ret = "{}.{}".format(prefix_, extension) if extension else prefix_
-            else:
-                i += 1
-                continue
-        else:
-            ret = fmt.format(prefix_, i, extension)
-
-        if not os.path.exists(ret):
-            break
-        i += 1
-        if i > 9999:
-            raise RuntimeError("Could not make a new file name for (prefix='{0!s}', extension='{1!s}')".format(prefix, extension))
-    return ret
+    if flag_minimal:
+        yield prefix_+dot_extension
+    template = prefix_.replace("%", "%%")+"-%04d"+dot_extension.replace("%", "%%")
+    for i in range(10000):
+        yield template % i
+    raise RuntimeError("Could not make a new file name for (prefix='{0!s}', extension='{1!s}')".format(prefix, extension))
 
 
 def temp_dir():
@@ -143,6 +150,9 @@ def temp_filename(prefix, extension=None):
                              flag_minimal=False)
 
 
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def sequential_filename(prefix, extension=None, num_digits=4):
     """
     Returns a file name that does not exist yet and continues numbering from last existing.
@@ -155,8 +165,7 @@ def sequential_filename(prefix, extension=None, num_digits=4):
     This was created to continue a sequence of files even is some of them have been deleted.
     """
 
-    # Note: the way extension is handled is different from new_filename(). For glob's sake, I decided to include the dot
-    # in extension, not in fmt
+    # Note: the way extension is handled is different from new_filename(): the dot is included in extension, not in fmt
 
     assert not isinstance(num_digits, bool)
 
@@ -170,14 +179,21 @@ def sequential_filename(prefix, extension=None, num_digits=4):
     # Removes tailing dash because it would look funny (but will be re-added in format string)
     prefix = prefix[:-1] if prefix.endswith("-") else prefix
 
-    ff = glob.glob(f"{prefix}-*{extension}")
-    ff.sort()
+    # Single directory pass looking for the greatest "{prefix}-(number)...{extension}"
+    dir_, head = os.path.split(prefix)
+    head += "-"
+    curr = -1
     try:
-        _, filename = os.path.split(ff[-1])
-        curr = int(re.match(f"{prefix}-(\d+)", ff[-1]).groups()[0])
-    except (IndexError, TypeError):
-        curr = -1
-
+        with os.scandir(dir_ or ".") as it:
+            for entry in it:
+                name = entry.name
+                endpos = len(name)-len(extension)
+                if endpos > len(head) and name.startswith(head) and name.endswith(extension):
+                    m = _DIGITS_RE.match(name, len(head), endpos)
+                    if m:
+                        curr = max(curr, int(m[0]))
+    except FileNotFoundError:
+        pass
 
     curr += 1
     ret = fmt.format(prefix, curr, extension)
@@ -200,23 +216,41 @@ def sequential_filename_with_dateslug(prefix, extension):
 
 
 
-_rename_to_temp_lock = Lock()
-
-
 def rename_to_temp(filename):
-    """*Thread-safe* renames file to temporary filename. Returns new name"""
-    with _rename_to_temp_lock:
-        root, ext = os.path.splitext(filename)
-        if len(ext) > 0:
-            ext = ext[1:]  # the dot (".") is originally included
-        new_name = new_filename(root, ext)
-        os.rename(filename, new_name)
+    """*Thread-safe* renames file to temporary filename. Returns new name
+
+    The new name is reserved by creating it exclusively (O_CREAT | O_EXCL, or mkdir() if filename is a directory)
+    before renaming over it, so concurrent callers (threads or processes) never pick the same name.
+    """
+    # raises FileNotFoundError before any name gets reserved
+    flag_dir = stat.S_ISDIR(os.lstat(filename).st_mode)
+    root, ext = os.path.splitext(filename)
+    for new_name in _iter_new_filenames(root, ext, True):
+        if new_name == filename:
+            continue
+        try:
+            if flag_dir:
+                os.mkdir(new_name, 0o700)
+            else:
+                os.close(os.open(new_name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+        except FileExistsError:
+            continue
+        try:
+            os.replace(filename, new_name)
+        except BaseException:
+            (os.rmdir if flag_dir else os.remove)(new_name)
+            raise
         return new_name
 
 
 def write_lf(h, s):
   """Adds lf to end of string and writes it to file."""
-  h.write(s+"\n")
+  h.writelines((s, "\n"))
+
+
+def write_lines(h, lines):
+  """Writes each string in lines to file followed by lf."""
+  h.writelines(x for line in lines for x in (line, "\n"))
 
 
 def create_symlink(source, link_name):
@@ -240,17 +274,7 @@ def create_symlink(source, link_name):
 
 
 # ## http://eli.thegreenplace.net/2011/10/19/perls-guess-if-file-is-text-or-binary-lemented-in-python
-_PY3 = sys.version_info[0] == 3
-
-# A function that takes an integer in the 8-bit range and returns
-# a single-character byte object in py3 / a single-character string
-# in py2.
-#
-_int2byte = (lambda x: bytes((x,))) if _PY3 else chr
-
-_text_characters = (
-        b''.join(_int2byte(i) for i in range(32, 127)) +
-        b'\n\r\t\f\b')
+_text_characters = bytes(range(32, 127))+b'\n\r\t\f\b'
 
 def is_text_file(filepath, blocksize=2**14):
     """ Uses heuristics to guess whether the given file is text or binary,
@@ -270,7 +294,7 @@ def is_text_file(filepath, blocksize=2**14):
         # Use translate's 'deletechars' argument to efficiently remove all
         # occurrences of _text_characters from the block
         nontext = block.translate(None, _text_characters)
-        return float(len(nontext)) / len(block) <= 0.30
+        return len(nontext) / len(block) <= 0.30
 
 
 def which(program):
@@ -313,7 +337,7 @@ def get_path(*args, module=a107):
 
 def ensure_path(path):
     """
-    Iteratively calls mkdir until full path exists.
+    Creates the full path (including missing parents) if it does not exist.
 
     Args:
         path: absolute or relative path ("~" character is allowed)
@@ -321,17 +345,10 @@ def ensure_path(path):
     Returns:
         whether any directory was created
     """
-    ret = False
     path = os.path.abspath(os.path.expanduser(path))
-    dd = [x for x in path.split(os.path.sep) if x]
-    sofar = ""
-    for d in dd:
-        sofar += os.path.sep+d
-        if not os.path.isdir(sofar):
-            os.mkdir(sofar)
-            ret = True
-
-    return ret
+    existed = os.path.isdir(path)
+    os.makedirs(path, exist_ok=True)
+    return not existed
 
 
 def open_html(html, prefix="a107temphtml"):
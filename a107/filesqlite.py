@@ -1,4 +1,5 @@
-import sqlite3, os, a107, io, numpy as np, pickle
+import sqlite3, os, a107, io, functools, itertools, operator, numpy as np, pickle, contextlib, threading, pathlib
+from numpy.lib import format as npformat
 
 __all__ = ["FileSQLite", "InvalidQuery", "NoData"]
 
@@ -10,6 +11,9 @@ class FileSQLite:
         path: full path to database file
         logger: used for logging important messages; defaults to a107.get_python_logger()
         master: used as alternative to access logger (master.logger) and other not yet specified operations
+        check_same_thread: passed to sqlite3.connect()
+        wal: switches the database to write-ahead logging, which lets readers (see read_conn()) proceed while a writer
+             is active
 
     I created this class because:
         1) (main reason) to configure the connection (row factory etc.) automatically
@@ -17,6 +21,9 @@ class FileSQLite:
            initialize if instead of creating an empty file as SQLite does
 
     2023-09-04: check_same_thread is set to False and sqlite.threadsafety==3 is ensured
+
+    For read-heavy multi-threaded use, open with wal=True and run queries inside read_conn(), so that each thread reads
+    through its own connection instead of queueing on self.conn.
     """
 
     @property
@@ -26,16 +33,13 @@ class FileSQLite:
                 if sqlite3.threadsafety != 3:
                     raise RuntimeError(f"check_same_thread is False, but sqlite.threadsafety is {sqlite3.threadsafety}. This is not safe!")
 
-
-            sqlite3.register_adapter(np.ndarray, adapt_array)  # Converts np.array to TEXT when inserting
-            sqlite3.register_converter("array", convert_array) # Converts TEXT to np.array when selecting
-            # sqlite3.register_adapter(object, adapt_object)
-            # sqlite3.register_converter("object", convert_object)
-
             self.__conn = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES,
                                           check_same_thread=self.check_same_thread)
             self.__conn.row_factory = sqlite3.Row
             # self.__conn.isolation_level = None
+            if self.wal and self.path != ":memory:":
+                self.__conn.execute("pragma journal_mode=WAL")
+                self.__conn.execute("pragma synchronous=NORMAL")
         return self.__conn
 
     @property
@@ -43,11 +47,14 @@ class FileSQLite:
         if self.__logger is None: self.__logger = a107.get_python_logger()
         return self.__logger
 
-    def __init__(self, path, logger=None, master=None, check_same_thread=False):
+    def __init__(self, path, logger=None, master=None, check_same_thread=False, wal=False):
         self.path = path
         self.__logger = logger
         self.__conn = None
+        self.__local = threading.local()
+        self.__read_conns = []
         self.check_same_thread = check_same_thread
+        self.wal = wal
         self.master = master
         if master is not None and logger is None and hasattr(master, "logger"):
             self.__logger = master.logger
@@ -78,10 +85,33 @@ class FileSQLite:
     def total_changes(self):
         return self.conn.total_changes
 
+    @contextlib.contextmanager
+    def read_conn(self):
+        """Yields read-only connection owned by the calling thread (opened on first use, kept until close()).
+
+        Falls back to self.conn for in-memory databases.
+        """
+        if self.path == ":memory:":
+            yield self.conn
+            return
+        conn = getattr(self.__local, "conn", None)
+        if conn is None:
+            uri = pathlib.Path(os.path.abspath(self.path)).as_uri()+"?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self.__local.conn = conn
+            self.__read_conns.append(conn)
+        yield conn
+
     def close(self):
         if self.__conn:
             self.__conn.close()
             self.__conn = None
+        if self.__read_conns:
+            for conn in self.__read_conns:
+                conn.close()
+            self.__read_conns = []
+            self.__local = threading.local()
 
     def create_database(self, flag_overwrite=False):
         """Creates database if it does not exist or if forced overwriting."""
@@ -127,7 +157,7 @@ class FileSQLite:
 
     def get_singlecolumn(self, *args, **kwargs):
         """Executes statement that presumably fechers one column per row."""
-        return [row[0] for row in self.execute(*args, **kwargs)]
+        return [row[0] for row in self.__execute_tuples(*args, **kwargs)]
 
     def get_singlerow(self, *args, **kwargs):
         """Executes statement that presumably fechers only one row."""
@@ -144,15 +174,21 @@ class FileSQLite:
 
     def get_lot(self, *args, **kwargs):
         """Executes select statement and converts result to List Of Tuples (LOT)."""
-        return [tuple(row) for row in self.execute(*args, **kwargs)]
+        return self.__execute_tuples(*args, **kwargs).fetchall()
 
     def get_lol(self, *args, **kwargs):
         """Executes select statement and converts result to List Of Lists (LOL)."""
-        return [list(row) for row in self.execute(*args, **kwargs)]
+        return [list(row) for row in self.__execute_tuples(*args, **kwargs)]
 
     def execute(self, *args, **kwargs):
         return self.conn.execute(*args, **kwargs)
 
+    def __execute_tuples(self, *args, **kwargs):
+        """Like execute(), but rows come as plain tuples instead of sqlite3.Row objects."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(*args, **kwargs)
+
     def executemany(self, *args, **kwargs):
         return self.conn.executemany(*args, **kwargs)
 
@@ -175,6 +211,44 @@ class FileSQLite:
         sql = f"insert into {tablename} ({fields}) values ({values})"
         return self.conn.executemany(sql, rows)
 
+    def bulk_insert_from_dicts(self, tablename, dicts, chunksize=10000):
+        """Inserts many rows from iterable of dicts within a single transaction, then commits.
+
+        Field names are taken from first dict; values are fetched by field name, so key order may vary between dicts.
+        See also configure_bulk().
+        """
+        it = iter(dicts)
+        first = next(it, None)
+        if first is None:
+            return
+        fieldnames = list(first.keys())
+        getter = operator.itemgetter(*fieldnames)
+        rows = map(getter, itertools.chain([first], it))
+        if len(fieldnames) == 1:
+            # itemgetter() with a single key returns the value itself
+            rows = ((x,) for x in rows)
+        fields = ", ".join(fieldnames)
+        values = ",".join(["?"]*len(fieldnames))
+        sql = f"insert into {tablename} ({fields}) values ({values})"
+        try:
+            while True:
+                chunk = list(itertools.islice(rows, chunksize))
+                if not chunk:
+                    break
+                self.conn.executemany(sql, chunk)
+        except:
+            self.rollback()
+            raise
+        self.commit()
+
+    def configure_bulk(self):
+        """Trades durability for speed when loading lots of data (e.g., a crash may corrupt the database)."""
+        e = self.conn.execute
+        e("pragma journal_mode=WAL")
+        e("pragma synchronous=OFF")
+        e("pragma temp_store=MEMORY")
+        e("pragma cache_size=-65536")
+
     def insert_from_dict(self, tablename, dict_):
         """Inserts rows using dictionary for fieldnames and values."""
 
@@ -195,22 +269,75 @@ class NoData(Exception): pass
 def adapt_array(arr):
     """
     http://stackoverflow.com/a/31312102/190597 (SoulNibbler)
+
+    Produces the same bytes as np.save(), but the .npy header is built only once per (dtype, order, shape).
     """
+    d = npformat.header_data_from_array_1_0(arr)
+    if isinstance(d["descr"], str) and not arr.dtype.hasobject:
+        try:
+            header = _npy_header(d["descr"], d["fortran_order"], d["shape"])
+        except ValueError:
+            # header too big for version 1.0
+            pass
+        else:
+            return sqlite3.Binary(header+arr.tobytes("F" if d["fortran_order"] else "C"))
     out = io.BytesIO()
     np.save(out, arr)
-    out.seek(0)
-    return sqlite3.Binary(out.read())
+    return sqlite3.Binary(out.getvalue())
 
 
 def convert_array(text):
-    out = io.BytesIO(text)
-    out.seek(0)
-    return np.load(out)
+    """Inverse of adapt_array(); reads anything written by np.save()."""
+    parsed = _parse_npy_header(bytes(text[:_npy_header_len(text)]))
+    if parsed is None:
+        return np.load(io.BytesIO(text))
+    shape, fortran_order, dtype, offset = parsed
+    ret = np.frombuffer(text, dtype, offset=offset)
+    ret = ret.reshape(shape[::-1]).T if fortran_order else ret.reshape(shape)
+    # np.load() returns a writeable array that owns its data
+    return ret.copy(order="K")
+
+
+@functools.lru_cache(maxsize=256)
+def _npy_header(descr, fortran_order, shape):
+    out = io.BytesIO()
+    npformat.write_array_header_1_0(out, {"descr": descr, "fortran_order": fortran_order, "shape": shape})
+    return out.getvalue()
+
+
+def _npy_header_len(text):
+    """Length of .npy magic + header. Header length field has 2 bytes in version 1.0 and 4 bytes afterwards."""
+    if text[6] == 1:
+        return 10+int.from_bytes(text[8:10], "little")
+    return 12+int.from_bytes(text[8:12], "little")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_npy_header(header):
+    """Returns (shape, fortran_order, dtype, data offset), or None if np.load() should handle it."""
+    f = io.BytesIO(header)
+    version = npformat.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = npformat.read_array_header_1_0(f)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = npformat.read_array_header_2_0(f)
+    else:
+        return None
+    if dtype.hasobject:
+        return None
+    return shape, fortran_order, dtype, f.tell()
 
 
 def adapt_object(object):
-    return sqlite3.Binary(pickle.dumps(object))
+    return sqlite3.Binary(pickle.dumps(object, protocol=pickle.HIGHEST_PROTOCOL))
 
 
 def convert_object(bytes_):
     return pickle.loads(bytes_)
+
+
+# Adapters/converters are process-wide, so they are registered once, when this module is imported
+sqlite3.register_adapter(np.ndarray, adapt_array)  # Converts np.array to TEXT when inserting
+sqlite3.register_converter("array", convert_array) # Converts TEXT to np.array when selecting
+# sqlite3.register_adapter(object, adapt_object)
+# sqlite3.register_converter("object", convert_object)
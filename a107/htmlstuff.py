@@ -1,29 +1,39 @@
 """Very poor HTML generation."""
 __all__ = ["rows2html", "tabulate_html", "row2html",]
 
+import io
 import tabulate
 
 def rows2html(rows, header=None, aligns=None, formats=None, flags_colorsign=None, tableclass=""):
     """Converts list of dicts to HTML table."""
-    buffer = [f"<table class={tableclass}>"]
+    buf = io.StringIO()
+    buf.write(f"<table class={tableclass}>")
     nc = len(rows[0])
     s_aligns = [""]*nc if not aligns else [f" align={align}" if align is not None else "" for align in aligns]
 
+    # Per-column invariants, resolved once instead of per cell
+    td_opens = [f"<td{s_aligns[j]}" for j in range(nc)]
+    formatters = [str if not formats or formats[j] is None
+                  else (lambda value, format_=formats[j]: format(value, format_)) for j in range(nc)]
+    colorsigns = [bool(flags_colorsign and flags_colorsign[j]) for j in range(nc)]
+
     for i, row in enumerate(rows):
         if i == 0:
             if not header: header = list(row.keys())
-            buffer.extend(["<tr>",
-                           "\n".join([f"<th{s_align}>{caption}</th>" for caption, s_align in zip(header, s_aligns)]),
-                           "</tr>"])
-        buffer.append("<tr>")
-        for j, value in enumerate(row.values()):
-            class_ = "" if not flags_colorsign or not flags_colorsign[j] \
-                else (" class="+("positive" if value > 0 else "negative" if value < 0 else "zero"))
-            s_value = str(value) if not formats or formats[j] is None else f"{value:{formats[j]}}"
-            buffer.append(f"<td{s_aligns[j]}{class_}>{s_value}</td>")
-        buffer.append("</tr>")
-    buffer.append("</table>")
-    return "\n".join(buffer)
+            buf.write("\n<tr>\n")
+            buf.write("\n".join([f"<th{s_align}>{caption}</th>" for caption, s_align in zip(header, s_aligns)]))
+            buf.write("\n</tr>")
+        buf.write("\n<tr>")
+        buf.write("".join([f"\n{td_open}{_colorsign_class(value) if colorsign else ''}>{formatter(value)}</td>"
+                           for td_open, formatter, colorsign, value
+                           in zip(td_opens, formatters, colorsigns, row.values())]))
+        buf.write("\n</tr>")
+    buf.write("\n</table>")
+    return buf.getvalue()
+
+
+def _colorsign_class(value):
+    return " class="+("positive" if value > 0 else "negative" if value < 0 else "zero")
 
 
 def tabulate_html(rows, header, tableclass=""):
@@ -37,10 +47,11 @@ def row2html(rows, header=None, tableclass=""):
     """Converts single-element list of dicts to 2-column HTML table."""
     if isinstance(rows, dict):
         rows = [rows]
-    buffer = [f"<table class={tableclass}>"]
+    buf = io.StringIO()
+    buf.write(f"<table class={tableclass}>")
     if not header: header = list(rows[0].keys())
     for i, row in enumerate(rows):
         for caption, value in zip(header, row.values()):
-            buffer.extend(["<tr>", f"<td class='header'>{caption.replace('<br>', ' ')}</td>", f"<td>{value}</td>", "</tr>"])
-    buffer.append("</table>")
-    return "\n".join(buffer)
+            buf.write(f"\n<tr>\n<td class='header'>{caption.replace('<br>', ' ')}</td>\n<td>{value}</td>\n</tr>")
+    buf.write("\n</table>")
+    return buf.getvalue()
@@ -4,10 +4,11 @@ __all__ = ["import_module", "collect_doc",
            "get_classes_in_module", "get_obj_doc0", "get_subpackages_names", "get_argsdict"]
 
 import os
-import glob
 # import imp
 import importlib
 import inspect
+import functools
+import operator
 import time
 from .fileio import slugify
 
@@ -59,12 +60,16 @@ def collect_doc(module, base_class=None, prefix="", flag_exclude_prefix=False):
         if prefix and not attrname.startswith(prefix):
             continue
 
-        attr = module.__getattribute__(attrname)
+        attr = getattr(module, attrname)
 
         if base_class is not None and not issubclass(attr, base_class):
             continue
 
-        spec = inspect.signature(attr)
+        try:
+            spec = _signature(attr)
+        except TypeError:
+            # unhashable callable
+            spec = inspect.signature(attr)
 
         ret.append((attrname if not flag_exclude_prefix else attrname[len(prefix):], spec, attr.__doc__))
 
@@ -82,19 +87,15 @@ def get_classes_in_module(module, superclass=object):
     Returns: list
     """
 
-    ret = []
-    for classname in dir(module):
-        attr = module.__getattribute__(classname)
-        try:
-            if issubclass(attr, superclass) and (attr != superclass):
-                ret.append(attr)
-        except TypeError:
-            # "issubclass() arg 1 must be a class"
-            pass
-        except RuntimeError:
-            # a99.get_python_logger().exception("Failed probing attribute '{}'".format(classname))
-            # raise
-            pass
+    namespace = vars(module)
+    if "__dir__" in namespace:
+        # module customizes its attribute list (e.g., lazy attributes in a107/__init__.py)
+        attrs = [getattr(module, classname) for classname in dir(module)]
+    else:
+        attrs = [attr for _, attr in sorted(namespace.items(), key=operator.itemgetter(0))]
+
+    ret = [attr for attr in attrs
+           if isinstance(attr, type) and attr is not superclass and issubclass(attr, superclass)]
     return ret
 
 
@@ -104,6 +105,9 @@ def get_obj_doc0(obj, alt="(no doc)"):
     return ret
 
 
+_INIT_NAMES = ("__init__.py", "__init__.pyc")
+
+
 def get_subpackages_names(dir_):
     """Figures out the names of the subpackages of a package
 
@@ -113,17 +117,34 @@ def get_subpackages_names(dir_):
     Source: http://stackoverflow.com/questions/832004/python-finding-all-packages-inside-a-package
     """
 
-    def is_package(d):
-        d = os.path.join(dir_, d)
-        return os.path.isdir(d) and glob.glob(os.path.join(d, '__init__.py*'))
-
-    ret = list(filter(is_package, os.listdir(dir_)))
+    ret = []
+    with os.scandir(dir_) as it:
+        for entry in it:
+            if entry.is_dir() and any(os.path.exists(os.path.join(entry.path, name)) for name in _INIT_NAMES):
+                ret.append(entry.name)
     ret.sort()
     return ret
 
 
 def get_argsdict(method, locals_):
     """Extracts method's argument values from local variables."""
-    sig = inspect.signature(method)
-    data = {paramname: locals_[paramname] for paramname in sig.parameters if paramname not in ("self",)}
+    # Cached by underlying function, so that cache does not hold bound instances alive
+    try:
+        paramnames = _get_paramnames(method.__func__, True) if inspect.ismethod(method) \
+            else _get_paramnames(method, False)
+    except TypeError:
+        # unhashable callable
+        paramnames = _get_paramnames.__wrapped__(method, False)
+    data = {paramname: locals_[paramname] for paramname in paramnames}
     return data
+
+
+_signature = functools.lru_cache(maxsize=1024)(inspect.signature)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_paramnames(function, flag_bound):
+    """Returns tuple of parameter names excluding "self" (and the first parameter if function is bound)."""
+    paramnames = list(inspect.signature(function).parameters)
+    if flag_bound: del paramnames[:1]
+    return tuple(paramname for paramname in paramnames if paramname != "self")
@@ -2,6 +2,7 @@
 __all__ = ["get_python_logger", "add_file_handler", "reset_logger", "LogTwo", "SmartFormatter", "str_exc", "get_new_logger",
            "log_exception_as_info", "log_exception_as_error", "ColorFormatter", "stre"]
 import logging, sys, traceback, os
+import a107
 from argparse import *
 from .parts import *
 from .fileio import ensure_path
@@ -12,13 +13,15 @@ def reset_logger():
     global _python_logger, _fmtr
     _python_logger = None
     _fmtr = None
+    _file_handlers.clear()
 
 _python_logger = None
 _fmtr = None
+# {absolute path: logging.FileHandler}; loggers logging to the same file share one handler (and file descriptor)
+_file_handlers = {}
 def _get_fmtr():
     global _fmtr
     if _fmtr is None:
-        import a107
         _fmtr = logging.Formatter(a107.logging_fmt)
     return _fmtr
 
@@ -29,7 +32,6 @@ def get_python_logger(name=None, fn_log=None):
     Therefore, if you want to change `a107.flag_log_file` or `a107.flag_log_console`, do so
     before calling get_python_logger(), otherwise these changes will be ineffective.
     """
-    import a107
     global _python_logger
     if _python_logger is None:
         _python_logger = get_new_logger(name=name, fn_log=fn_log)
@@ -39,7 +41,6 @@ def get_python_logger(name=None, fn_log=None):
 
 def get_new_logger(level=None, flag_log_console=None, flag_log_file=None, fn_log=None, name=None):
     """Creates new logger (automatically creates log file directory if needed."""
-    import a107
     if name is None:
         name = a107.logging_name
     if level is None:
@@ -65,12 +66,15 @@ def get_new_logger(level=None, flag_log_console=None, flag_log_file=None, fn_log
 def add_file_handler(logger, logFilename=None):
     """Adds file handler to logger.
 
-    File is opened in "a" mode (append)
+    File is opened in "a" mode (append). The handler is reused for all loggers logging to the same file.
     """
     assert isinstance(logger, logging.Logger)
-    ch = logging.FileHandler(logFilename, "a")
-    # ch.setFormatter(logging._defaultFormatter) # todo may change to have same formatter as last handler of logger
-    ch.setFormatter(_get_fmtr())
+    path = os.path.abspath(logFilename)
+    ch = _file_handlers.get(path)
+    if ch is None:
+        ch = _file_handlers[path] = logging.FileHandler(logFilename, "a")
+        # ch.setFormatter(logging._defaultFormatter) # todo may change to have same formatter as last handler of logger
+        ch.setFormatter(_get_fmtr())
     logger.addHandler(ch)
 
 
@@ -79,12 +83,17 @@ class LogTwo(object):
     """Logs messages to both stdout and file."""
     def __init__(self, filename):
         self.terminal = sys.stdout
-        self.log = open(filename, "w")
+        # Line-buffered: the file gets one write per line instead of one per write() call, and is up-to-date per line
+        self.log = open(filename, "w", buffering=1)
 
     def write(self, message):
         self.terminal.write(message)
         self.log.write(message)
 
+    def flush(self):
+        self.terminal.flush()
+        self.log.flush()
+
     def close(self):
         self.log.close()
 
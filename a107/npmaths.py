@@ -2,7 +2,8 @@
 
 __all__ = ["triangularwave", "sigmoid", "make_impulseresponse"]
 
-import numpy as np, scipy.interpolate
+import functools
+import numpy as np
 
 def triangularwave(period, numpoints):
     """Triangular wave ranging from 0 to 1 with given period and given number of points.
@@ -22,9 +23,12 @@ def triangularwave(period, numpoints):
     0.20  ┤ ╭╯              ╰╮  ╭╯              ╰╮  ╭╯              ╰╮  ╭╯              ╰╮  ╭╯              ╰╮
     0.00  ┼─╯                ╰──╯                ╰──╯                ╰──╯                ╰──╯                ╰─
     """
-    i = np.arange(numpoints)
     halfperiod = period/2
-    ret = (halfperiod-np.abs(i % period - halfperiod))/halfperiod
+    # Same as (halfperiod-np.abs(i % period - halfperiod))/halfperiod, reusing one buffer for all steps after the first
+    ret = np.arange(numpoints) % period - halfperiod
+    np.abs(ret, out=ret)
+    np.subtract(halfperiod, ret, out=ret)
+    ret /= halfperiod
     return ret
 
 
@@ -49,11 +53,42 @@ def sigmoid(a, c, numpoints_or_x):
         1.00  ┤                         ╰───
     """
     if np.isscalar(numpoints_or_x):
+        if numpoints_or_x <= _SIGMOID_CACHE_MAXPOINTS:
+            try:
+                return _sigmoid_numpoints(a, c, numpoints_or_x).copy()
+            except TypeError:
+                # unhashable a or c
+                pass
         x = np.linspace(0, numpoints_or_x-1, numpoints_or_x)
     else:
         x = numpoints_or_x
 
-    return 1.0/(1.0+np.exp(-a*(x-c)))
+    return _sigmoid(a, c, x)
+
+
+# Larger signals are computed directly: caching them would pin a lot of memory, and the copy costs about as much anyway
+_SIGMOID_CACHE_MAXPOINTS = 4096
+
+
+@functools.lru_cache(maxsize=128)
+def _sigmoid_numpoints(a, c, numpoints):
+    """Cached (read-only) sigmoid() of numpoints points, as it is often called repeatedly with the same arguments."""
+    ret = _sigmoid(a, c, np.linspace(0, numpoints-1, numpoints))
+    ret.flags.writeable = False
+    return ret
+
+
+def _sigmoid(a, c, x):
+    # Same as 1.0/(1.0+np.exp(-a*(x-c))), reusing one buffer for all steps after the first
+    ret = -a*(x-c)
+    if np.ndim(ret) == 0:
+        # scalar: there is no buffer to reuse
+        return 1.0/(1.0+np.exp(ret))
+    if ret.dtype.kind not in "fc": ret = ret.astype(float)
+    np.exp(ret, out=ret)
+    ret += 1.0
+    np.reciprocal(ret, out=ret)
+    return ret
 
 
 def make_impulseresponse(H, size, flag_add_zero=True):
@@ -94,7 +129,5 @@ def make_impulseresponse(H, size, flag_add_zero=True):
         0.00  ┤   ╰              ╰                   ╰
     """
     if flag_add_zero and H[-1] != 0: H = np.concatenate((H, [0.]))
-    x = range(len(H))
-    interpolator = scipy.interpolate.interp1d(x, H)
-    ret = interpolator(np.linspace(0, len(H)-1, size))
+    ret = np.interp(np.linspace(0, len(H)-1, size), np.arange(len(H)), np.asarray(H, dtype=np.float64))
     return ret
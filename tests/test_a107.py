@@ -1,7 +1,70 @@
 # Installing all required packages is not so easy, will try another time
 # import a107
+import os
+import datetime
+import pytest
+import numpy as np
+import a107
 
 
 def test_import():
     """Does nothing, just lets import above be tested
-    """
\ No newline at end of file
+    """
+
+
+def test_rename_to_temp_missing_file(tmp_path):
+    fn = str(tmp_path/"nothere.txt")
+    with pytest.raises(FileNotFoundError):
+        a107.rename_to_temp(fn)
+    assert os.listdir(tmp_path) == []
+
+
+def test_rename_to_temp(tmp_path):
+    fn = str(tmp_path/"x.txt")
+    open(fn, "w").close()
+    assert a107.rename_to_temp(fn) == str(tmp_path/"x-0000.txt")
+    assert os.listdir(tmp_path) == ["x-0000.txt"]
+
+
+def test_rename_to_temp_dir(tmp_path):
+    dir_ = str(tmp_path/"d1")
+    os.mkdir(dir_)
+    open(os.path.join(dir_, "f"), "w").close()
+    assert a107.rename_to_temp(dir_) == str(tmp_path/"d1-0000")
+    assert os.listdir(tmp_path) == ["d1-0000"]
+    assert os.listdir(tmp_path/"d1-0000") == ["f"]
+
+
+def test_new_filename_case_insensitive(tmp_path, monkeypatch):
+    # Emulates a case-insensitive filesystem (macOS, Windows)
+    monkeypatch.setattr(os.path, "exists", lambda path: os.path.basename(path).lower() in
+                        {name.lower() for name in os.listdir(os.path.dirname(path))})
+    for name in ("X.dat", "x-0000.dat"):
+        open(tmp_path/name, "w").close()
+    assert a107.new_filename(str(tmp_path/"X"), "dat") == str(tmp_path/"X-0001.dat")
+
+
+def test_sigmoid_0d():
+    assert a107.sigmoid(1, 2, np.array(3.)) == pytest.approx(1/(1+np.exp(-1)))
+
+
+def test_str2dt():
+    assert a107.str2dt("2022-01-06 10:03:59") == datetime.datetime(2022, 1, 6, 10, 3, 59)
+    assert a107.str2dt("2022-01-06") == datetime.datetime(2022, 1, 6)
+    with pytest.raises(ValueError):
+        a107.str2dt("2022-W01-1 10:03:59")
+
+
+def test_seconds2time_numpy_scalar():
+    assert a107.seconds2time(np.float32(3661.5)) == datetime.time(1, 1, 1, 500000)
+
+
+def test_ordinal_suffix():
+    assert [a107.ordinal_suffix(i) for i in (1, 2, 3, 4, 11, 12, 13, 21, 22, 23, 111, 112)] == \
+           ["st", "nd", "rd", "th", "th", "th", "th", "st", "nd", "rd", "th", "th"]
+    assert a107.ordinal_suffix("22") == "nd"
+    assert a107.ordinal_suffix(3.0) == "rd"
+
+
+def test_int2superscript():
+    assert a107.int2superscript(1234567890) == "\u00b9\u00b2\u00b3\u2074\u2075\u2076\u2077\u2078\u2079\u2070"